@@ -0,0 +1,47 @@
+from django.contrib import admin
+from django.utils.html import format_html
+from django.utils.translation import gettext_lazy as _
+
+from core.models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("id", "task", "status", "progress_bar", "processed", "failed", "created_by", "created_at")
+    list_filter = ("status", "task")
+    readonly_fields = (
+        "task",
+        "status",
+        "progress_bar",
+        "total",
+        "processed",
+        "failed",
+        "error_list",
+        "created_by",
+        "created_at",
+        "started_at",
+        "finished_at",
+    )
+    exclude = ("payload", "errors")
+
+    @admin.display(description=_("Progress"))
+    def progress_bar(self, obj: Job):
+        return format_html(
+            '<progress max="100" value="{}"></progress> {}% ({}/{})', obj.progress, obj.progress, obj.done, obj.total
+        )
+
+    @admin.display(description=_("Errors"))
+    def error_list(self, obj: Job):
+        return format_html("<br>".join(["{}"] * len(obj.errors)), *obj.errors) if obj.errors else "-"
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request).select_related("created_by")
+        if request.user.is_superuser or request.user.groups.filter(name="Admin").exists():
+            return qs
+        return qs.filter(created_by=request.user)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
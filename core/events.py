@@ -0,0 +1,98 @@
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Optional
+
+import psycopg
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DatabaseError, connection, connections, transaction
+
+logger = logging.getLogger("core")
+
+CHANNEL = "workshop_events"
+CLIENT_QUEUE_SIZE = 100
+RECONNECT_DELAY = 5.0
+
+
+def publish(event: str, data: dict) -> None:
+    """Broadcast ``event`` to live streams once the current transaction commits.
+
+    Delivery goes through PostgreSQL ``NOTIFY`` so every worker process sees it; on other
+    database backends events are dropped.
+    """
+    message = json.dumps({"event": event, "data": data}, cls=DjangoJSONEncoder)
+    transaction.on_commit(lambda: _notify(message))
+
+
+def _notify(message: str) -> None:
+    if connection.vendor != "postgresql":
+        return
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, message])
+    except DatabaseError:
+        # The data is already committed; a lost board update must not turn the write into an error.
+        logger.exception("Could not publish board event")
+
+
+class Broadcaster:
+    """One ``LISTEN`` connection per process, fanned out to a queue per connected client.
+
+    The connection is opened with the first subscriber and closed after the last one leaves.
+    """
+
+    def __init__(self) -> None:
+        self._clients: set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self._clients.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._clients.discard(queue)
+        if not self._clients and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def dispatch(self, message: dict) -> None:
+        for queue in list(self._clients):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # A stalled client only misses updates; it must not hold back the others.
+                logger.warning("Dropping board event for a slow client")
+
+    async def _run(self) -> None:
+        params = connections["default"].get_connection_params()
+        # Django-specific cursor and adapter settings do not apply to this raw async connection.
+        params.pop("cursor_factory", None)
+        params.pop("context", None)
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(**params, autocommit=True) as conn:
+                    await conn.execute(f"LISTEN {CHANNEL}")
+                    async for notify in conn.notifies():
+                        self.dispatch(json.loads(notify.payload))
+            except psycopg.OperationalError as exc:
+                logger.warning("Event listener connection lost: %s", exc)
+                await asyncio.sleep(RECONNECT_DELAY)
+
+
+broadcaster = Broadcaster()
+
+
+async def listen(heartbeat: float = 15.0) -> AsyncIterator[Optional[dict]]:
+    """Yield published events as they arrive, and ``None`` after ``heartbeat`` seconds of silence."""
+    queue = broadcaster.subscribe()
+    try:
+        while True:
+            try:
+                yield await asyncio.wait_for(queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield None
+    finally:
+        broadcaster.unsubscribe(queue)
@@ -0,0 +1,131 @@
+import logging
+import uuid
+from datetime import timedelta
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.utils import timezone
+
+from core.models import Job
+
+logger = logging.getLogger("core")
+
+CHUNK_SIZE = 50
+MAX_ERRORS = 100
+# A running job whose progress has not moved for this long lost its worker and is picked up again.
+STALE_AFTER = timedelta(minutes=15)
+
+# task name -> (model, handler applied to one instance)
+TASKS: dict[str, tuple[type[models.Model], Callable]] = {}
+
+
+def register(name: str, model: type[models.Model]):
+    def decorator(handler: Callable) -> Callable:
+        TASKS[name] = (model, handler)
+        return handler
+
+    return decorator
+
+
+def should_queue(count: int) -> bool:
+    return count > settings.JOB_INLINE_LIMIT
+
+
+def enqueue(task: str, ids: list[int], user=None) -> Job:
+    if task not in TASKS:
+        raise KeyError(f"Unknown job task {task!r}")
+    return Job.objects.create(task=task, payload={"ids": ids}, total=len(ids), created_by=user)
+
+
+class JobLost(Exception):
+    """Another worker re-claimed the job while this one was still running it."""
+
+
+def claim_next() -> Optional[Job]:
+    with transaction.atomic():
+        stale = timezone.now() - STALE_AFTER
+        job = (
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(
+                models.Q(status=Job.Status.QUEUED) | models.Q(status=Job.Status.RUNNING, updated_at__lt=stale)
+            )
+            .order_by("created_at")
+            .first()
+        )
+        if job is None:
+            return None
+        job.status = Job.Status.RUNNING
+        job.started_at = job.started_at or timezone.now()
+        job.worker_token = uuid.uuid4()
+        job.save(update_fields=["status", "started_at", "worker_token"])
+        return job
+
+
+def run(job: Job) -> None:
+    """Process ``job`` chunk by chunk, committing each chunk together with its progress.
+
+    Progress is stored in the chunk transaction, so a job resumed after a crash continues
+    from the first uncommitted chunk. A chunk whose job was re-claimed meanwhile is rolled back.
+    """
+    if job.task not in TASKS:
+        raise LookupError(f"Unknown task {job.task!r}")
+    model, handler = TASKS[job.task]
+
+    try:
+        ids = job.payload["ids"]
+        for start in range(job.done, len(ids), CHUNK_SIZE):
+            chunk = ids[start : start + CHUNK_SIZE]
+            with transaction.atomic():
+                instances = model.objects.in_bulk(chunk)
+                for pk in chunk:
+                    error = _apply(handler, instances.get(pk), pk)
+                    if error is None:
+                        job.processed += 1
+                    else:
+                        job.failed += 1
+                        if len(job.errors) < MAX_ERRORS:
+                            job.errors.append(f"#{pk}: {error}")
+                _save_if_owned(job, ["processed", "failed", "errors"])
+
+        job.status = Job.Status.COMPLETED
+        job.finished_at = timezone.now()
+        with transaction.atomic():
+            _save_if_owned(job, ["status", "finished_at"])
+    except JobLost:
+        logger.warning("Job %s was re-claimed by another worker; abandoning it here", job.pk)
+        return
+    logger.info("Job %s finished: %s processed, %s failed", job.pk, job.processed, job.failed)
+
+
+def fail(job: Job, exc: BaseException) -> None:
+    """Mark ``job`` failed after an error outside the per-item savepoints, unless another worker owns it now."""
+    errors = Job.objects.filter(pk=job.pk).values_list("errors", flat=True).first() or []
+    now = timezone.now()
+    Job.objects.filter(pk=job.pk, worker_token=job.worker_token).update(
+        status=Job.Status.FAILED,
+        errors=[*errors, f"Job failed: {exc}"],
+        finished_at=now,
+        updated_at=now,
+    )
+
+
+def _save_if_owned(job: Job, fields: list[str]) -> None:
+    if not Job.objects.select_for_update().filter(pk=job.pk, worker_token=job.worker_token).exists():
+        raise JobLost
+    job.save(update_fields=fields)
+
+
+def _apply(handler: Callable, instance, pk) -> Optional[str]:
+    if instance is None:
+        return "not found"
+    try:
+        with transaction.atomic():
+            handler(instance)
+    except ValidationError as exc:
+        return "; ".join(exc.messages)
+    except Exception as exc:
+        logger.exception("Job item %s failed", pk)
+        return str(exc)
+    return None
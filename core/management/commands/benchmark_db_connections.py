@@ -0,0 +1,60 @@
+import statistics
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import connection
+
+
+class Command(BaseCommand):
+    help = "Measure requests per second and latency of the request/connection lifecycle against the database"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000, help="Total simulated requests")
+        parser.add_argument("--concurrency", type=int, default=8, help="Worker threads")
+
+    def handle(self, *args, **options):
+        total = options["requests"]
+        concurrency = options["concurrency"]
+        per_thread = max(total // concurrency, 1)
+        latencies: list[float] = []
+        lock = threading.Lock()
+
+        def worker():
+            local = []
+            for _ in range(per_thread):
+                started = time.perf_counter()
+                # Same signals the WSGI/ASGI handlers send, so CONN_MAX_AGE and the pool behave as in production.
+                request_started.send(sender=self.__class__)
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    cursor.fetchone()
+                request_finished.send(sender=self.__class__)
+                local.append(time.perf_counter() - started)
+            connection.close()
+            with lock:
+                latencies.extend(local)
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        settings_dict = connection.settings_dict
+        pool = settings_dict.get("OPTIONS", {}).get("pool")
+        latencies.sort()
+        p99 = latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)]
+        self.stdout.write(
+            f"CONN_MAX_AGE={settings_dict['CONN_MAX_AGE']} "
+            f"CONN_HEALTH_CHECKS={settings_dict['CONN_HEALTH_CHECKS']} pool={pool or 'off'}"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(latencies)} requests, {concurrency} threads: {len(latencies) / elapsed:.1f} req/s, "
+                f"p50 {statistics.median(latencies) * 1000:.2f} ms, p99 {p99 * 1000:.2f} ms"
+            )
+        )
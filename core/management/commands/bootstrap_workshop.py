@@ -17,7 +17,7 @@ class Command(BaseCommand):
         tech_perms = Permission.objects.filter(
             content_type__app_label="repairs",
             codename__in=["add_repair", "change_repair", "view_repair", "add_repairpartusage", "change_repairpartusage"],
-        )
+        ) | Permission.objects.filter(content_type__app_label="core", codename="view_job")
         tech_group.permissions.set(tech_perms)
 
         admin_perms = Permission.objects.all()
@@ -0,0 +1,248 @@
+import json
+import shutil
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Optional
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import DecimalField, ExpressionWrapper, F, Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from inventory.models import Part
+from repairs.models import Device, Repair, RepairPartUsage
+
+WATERMARK_FILE = "_watermarks.json"
+BATCH_SIZE = 50_000
+# updated_at is stamped at save() time, before commit. The cutoff stays behind both this lag and the start of
+# the oldest open transaction, so rows it has not committed yet land after the watermark.
+COMMIT_LAG = timedelta(minutes=1)
+
+
+def oldest_open_transaction() -> Optional[datetime]:
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT min(xact_start) FROM pg_stat_activity "
+            "WHERE datname = current_database() AND pid <> pg_backend_pid() AND xact_start IS NOT NULL"
+        )
+        return cursor.fetchone()[0]
+
+
+def batched(rows, size: int):
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def line_cost(quantity: str, price: str) -> ExpressionWrapper:
+    return ExpressionWrapper(F(quantity) * F(price), output_field=DecimalField(max_digits=14, decimal_places=2))
+
+
+def repair_rows(queryset):
+    rows = queryset.annotate(
+        device_name=F("device__name"),
+        technician=F("created_by__username"),
+        parts_cost=Sum(line_cost("part_usages__quantity", "part_usages__part__price")),
+    ).values(
+        "id",
+        "created_at",
+        "updated_at",
+        "status",
+        "device_id",
+        "device_name",
+        "created_by_id",
+        "technician",
+        "serial_number",
+        "defect",
+        "repair_difficulty",
+        "type_of_repair",
+        "parts_cost",
+    )
+    for row in rows.iterator(chunk_size=BATCH_SIZE):
+        row["month"] = row["created_at"].strftime("%Y-%m")
+        yield row
+
+
+def usage_rows(queryset):
+    rows = queryset.annotate(
+        part_code=F("part__code"),
+        part_name=F("part__name"),
+        part_price=F("part__price"),
+        supplier=F("part__supplier"),
+        line_cost=line_cost("quantity", "part__price"),
+        device_id=F("repair__device_id"),
+        device_name=F("repair__device__name"),
+        repair_status=F("repair__status"),
+    ).values(
+        "id",
+        "repair_id",
+        "part_id",
+        "part_code",
+        "part_name",
+        "part_price",
+        "supplier",
+        "quantity",
+        "line_cost",
+        "written_off",
+        "date_used",
+        "updated_at",
+        "device_id",
+        "device_name",
+        "repair_status",
+    )
+    for row in rows.iterator(chunk_size=BATCH_SIZE):
+        row["month"] = timezone.localtime(row["date_used"]).strftime("%Y-%m")
+        yield row
+
+
+def part_rows(queryset):
+    yield from queryset.values(
+        "id", "code", "name", "supplier", "price", "current_stock", "reserved", "min_stock", "lead_time_days", "updated_at"
+    ).iterator(chunk_size=BATCH_SIZE)
+
+
+def device_rows(queryset):
+    yield from queryset.values("id", "name", "is_active", "updated_at").iterator(chunk_size=BATCH_SIZE)
+
+
+# table name -> (model, row builder, partition columns)
+TABLES = {
+    "repairs": (Repair, repair_rows, ["month"]),
+    "part_usages": (RepairPartUsage, usage_rows, ["month"]),
+    "parts": (Part, part_rows, None),
+    "devices": (Device, device_rows, None),
+}
+
+
+def table_schemas(pa) -> dict:
+    """Fixed schemas so every appended file matches, even when a batch has only null costs."""
+    money = pa.decimal128(10, 2)
+    total = pa.decimal128(14, 2)
+    timestamp = pa.timestamp("us", tz="UTC")
+    return {
+        "repairs": pa.schema(
+            [
+                ("id", pa.int64()),
+                ("created_at", pa.date32()),
+                ("updated_at", timestamp),
+                ("status", pa.string()),
+                ("device_id", pa.int64()),
+                ("device_name", pa.string()),
+                ("created_by_id", pa.int64()),
+                ("technician", pa.string()),
+                ("serial_number", pa.string()),
+                ("defect", pa.string()),
+                ("repair_difficulty", pa.string()),
+                ("type_of_repair", pa.string()),
+                ("parts_cost", total),
+                ("month", pa.string()),
+            ]
+        ),
+        "part_usages": pa.schema(
+            [
+                ("id", pa.int64()),
+                ("repair_id", pa.int64()),
+                ("part_id", pa.int64()),
+                ("part_code", pa.string()),
+                ("part_name", pa.string()),
+                ("part_price", money),
+                ("supplier", pa.string()),
+                ("quantity", pa.int64()),
+                ("line_cost", total),
+                ("written_off", pa.bool_()),
+                ("date_used", timestamp),
+                ("updated_at", timestamp),
+                ("device_id", pa.int64()),
+                ("device_name", pa.string()),
+                ("repair_status", pa.string()),
+                ("month", pa.string()),
+            ]
+        ),
+        "parts": pa.schema(
+            [
+                ("id", pa.int64()),
+                ("code", pa.string()),
+                ("name", pa.string()),
+                ("supplier", pa.string()),
+                ("price", money),
+                ("current_stock", pa.int64()),
+                ("reserved", pa.int64()),
+                ("min_stock", pa.int64()),
+                ("lead_time_days", pa.int64()),
+                ("updated_at", timestamp),
+            ]
+        ),
+        "devices": pa.schema(
+            [
+                ("id", pa.int64()),
+                ("name", pa.string()),
+                ("is_active", pa.bool_()),
+                ("updated_at", timestamp),
+            ]
+        ),
+    }
+
+
+class Command(BaseCommand):
+    help = "Append repairs, part usages, parts and devices changed since the last run to Parquet snapshots"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=str(settings.ANALYTICS_DIR), help="Snapshot directory")
+        parser.add_argument("--full", action="store_true", help="Ignore watermarks and export every row")
+
+    def handle(self, *args, **options):
+        try:
+            import pyarrow as pa
+            import pyarrow.dataset as ds
+        except ImportError as exc:
+            raise CommandError("pyarrow is required for analytics exports: pip install pyarrow") from exc
+
+        output = Path(options["output"])
+        output.mkdir(parents=True, exist_ok=True)
+        watermark_path = output / WATERMARK_FILE
+        if options["full"]:
+            for name in TABLES:
+                shutil.rmtree(output / name, ignore_errors=True)
+            watermarks = {}
+        else:
+            watermarks = json.loads(watermark_path.read_text()) if watermark_path.exists() else {}
+        schemas = table_schemas(pa)
+        cutoff = timezone.now() - COMMIT_LAG
+        oldest = oldest_open_transaction()
+        if oldest is not None:
+            cutoff = min(cutoff, oldest)
+        stamp = cutoff.strftime("%Y%m%dT%H%M%S")
+
+        for name, (model, build_rows, partitioning) in TABLES.items():
+            previous = parse_datetime(watermarks[name]) if name in watermarks else None
+            if previous is not None and cutoff <= previous:
+                # A transaction older than the last run is still open; keep the watermark where it is.
+                self.stdout.write(f"{name}: 0 rows")
+                continue
+            queryset = model.objects.filter(updated_at__lt=cutoff).order_by("pk")
+            if previous is not None:
+                queryset = queryset.filter(updated_at__gte=previous)
+
+            exported = 0
+            for batch in batched(build_rows(queryset), BATCH_SIZE):
+                ds.write_dataset(
+                    pa.Table.from_pylist(batch, schema=schemas[name]),
+                    output / name,
+                    format="parquet",
+                    partitioning=partitioning,
+                    partitioning_flavor="hive" if partitioning else None,
+                    basename_template=f"part-{stamp}-{exported}-{{i}}.parquet",
+                    existing_data_behavior="overwrite_or_ignore",
+                )
+                exported += len(batch)
+
+            watermarks[name] = cutoff.isoformat()
+            self.stdout.write(f"{name}: {exported} rows")
+
+        watermark_path.write_text(json.dumps(watermarks, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Analytics snapshot written to {output}"))
@@ -0,0 +1,37 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections
+
+from core import jobs
+
+logger = logging.getLogger("core")
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Exit when the queue is empty")
+        parser.add_argument("--sleep", type=float, default=2.0, help="Seconds to wait when the queue is empty")
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            job = jobs.claim_next()
+            if job is not None:
+                self.stdout.write(f"Running job #{job.pk} {job.task} ({job.total} items)")
+                try:
+                    jobs.run(job)
+                except Exception as exc:
+                    logger.exception("Job %s failed", job.pk)
+                    try:
+                        jobs.fail(job, exc)
+                    except DatabaseError:
+                        # Left Running; another worker picks it up once it goes stale.
+                        logger.exception("Could not mark job %s as failed", job.pk)
+                continue
+            if options["once"]:
+                return
+            time.sleep(options["sleep"])
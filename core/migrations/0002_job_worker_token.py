@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="worker_token",
+            field=models.UUIDField(blank=True, editable=False, null=True, verbose_name="Worker token"),
+        ),
+    ]
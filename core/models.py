@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class TimeStampedModel(models.Model):
+    """Tracks the last modification time, including partial ``save(update_fields=...)`` calls."""
+
+    updated_at = models.DateTimeField(_("Updated at"), auto_now=True, db_index=True)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "updated_at"}
+        return super().save(*args, **kwargs)
+
+
+class Job(TimeStampedModel):
+    class Status(models.TextChoices):
+        QUEUED = "Queued", _("Queued")
+        RUNNING = "Running", _("Running")
+        COMPLETED = "Completed", _("Completed")
+        FAILED = "Failed", _("Failed")
+
+    task = models.CharField(_("Task"), max_length=100)
+    payload = models.JSONField(_("Payload"), default=dict)
+    status = models.CharField(_("Status"), max_length=32, choices=Status.choices, default=Status.QUEUED)
+    total = models.PositiveIntegerField(_("Total"), default=0)
+    processed = models.PositiveIntegerField(_("Processed"), default=0)
+    failed = models.PositiveIntegerField(_("Failed"), default=0)
+    errors = models.JSONField(_("Errors"), default=list, blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("Created by"),
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="jobs",
+    )
+    created_at = models.DateTimeField(_("Created at"), auto_now_add=True)
+    started_at = models.DateTimeField(_("Started at"), null=True, blank=True)
+    finished_at = models.DateTimeField(_("Finished at"), null=True, blank=True)
+    worker_token = models.UUIDField(_("Worker token"), null=True, blank=True, editable=False)
+
+    class Meta:
+        verbose_name = _("Job")
+        verbose_name_plural = _("Jobs")
+        indexes = [models.Index(fields=["status", "created_at"])]
+
+    def __str__(self) -> str:
+        return f"#{self.pk} {self.task} ({self.status})"
+
+    @property
+    def done(self) -> int:
+        return self.processed + self.failed
+
+    @property
+    def progress(self) -> int:
+        if not self.total:
+            return 100 if self.status == self.Status.COMPLETED else 0
+        return round(self.done * 100 / self.total)
@@ -0,0 +1,204 @@
+import asyncio
+import tempfile
+import uuid
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from core import events, jobs
+from core.models import Job
+from inventory.models import Part
+from repairs.models import Device, Repair, RepairPartUsage
+
+try:
+    import psycopg_pool
+except ImportError:  # pragma: no cover - optional dependency
+    psycopg_pool = None
+
+try:
+    import pyarrow.dataset as ds
+except ImportError:  # pragma: no cover - optional dependency
+    ds = None
+
+
+@skipUnless(ds, "pyarrow is not installed")
+class ExportAnalyticsTests(TestCase):
+    def setUp(self):
+        self.output = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        user = get_user_model().objects.create_user(username="tech", password="x")
+        self.device = Device.objects.create(name="CashCode Bill")
+        self.part = Part.objects.create(code="BELT-320", name="Belt", current_stock=5, price="12.50")
+        self.repair = Repair.objects.create(device=self.device, created_by=user, serial_number="SN1", defect="Jams")
+        RepairPartUsage.objects.create(repair=self.repair, part=self.part, quantity=2)
+
+    def export(self, at):
+        with mock.patch("django.utils.timezone.now", return_value=at):
+            call_command("export_analytics", output=str(self.output), stdout=mock.Mock())
+
+    def read(self, name):
+        return ds.dataset(self.output / name, format="parquet", partitioning="hive").to_table().to_pylist()
+
+    def test_export_includes_join_columns(self):
+        self.export(timezone.now() + timedelta(minutes=2))
+        usage = self.read("part_usages")[0]
+        self.assertEqual(usage["device_name"], "CashCode Bill")
+        self.assertEqual(str(usage["line_cost"]), "25.00")
+        self.assertEqual(self.read("repairs")[0]["month"], timezone.localdate().strftime("%Y-%m"))
+
+    def test_cutoff_stays_behind_open_transactions(self):
+        start = timezone.now()
+        with mock.patch(
+            "core.management.commands.export_analytics.oldest_open_transaction",
+            return_value=start - timedelta(minutes=30),
+        ):
+            self.export(start + timedelta(minutes=2))
+        self.assertFalse((self.output / "repairs").exists())
+        self.export(start + timedelta(minutes=3))
+        self.assertEqual(len(self.read("repairs")), 1)
+
+        watermarks = (self.output / "_watermarks.json").read_text()
+        with mock.patch(
+            "core.management.commands.export_analytics.oldest_open_transaction",
+            return_value=start - timedelta(minutes=30),
+        ):
+            self.export(start + timedelta(minutes=4))
+        self.assertEqual((self.output / "_watermarks.json").read_text(), watermarks)
+        self.export(start + timedelta(minutes=5))
+        self.assertEqual(len(self.read("repairs")), 1)
+
+    def test_second_run_appends_only_changed_rows(self):
+        start = timezone.now()
+        self.export(start + timedelta(minutes=2))
+        with mock.patch("django.utils.timezone.now", return_value=start + timedelta(minutes=3)):
+            self.repair.note = "Belt replaced"
+            self.repair.save(update_fields=["note"])
+        self.export(start + timedelta(minutes=10))
+        self.assertEqual([row["id"] for row in self.read("repairs")], [self.repair.pk, self.repair.pk])
+        self.assertEqual(len(self.read("part_usages")), 1)
+
+
+class JobRunnerTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser(username="admin", password="x")
+        device = Device.objects.create(name="CashCode Bill")
+        self.part = Part.objects.create(code="BELT-320", name="Belt", current_stock=5)
+        self.repairs = [
+            Repair.objects.create(device=device, created_by=self.user, serial_number=f"SN{i}", defect="Jams")
+            for i in range(3)
+        ]
+        RepairPartUsage.objects.create(repair=self.repairs[0], part=self.part, quantity=2)
+
+    def test_job_completes_items_and_records_failures(self):
+        missing_pk = self.repairs[-1].pk + 1
+        ids = [repair.pk for repair in self.repairs] + [missing_pk]
+        job = jobs.enqueue("repairs.mark_as_completed", ids, self.user)
+        with mock.patch.object(jobs, "CHUNK_SIZE", 2):
+            jobs.run(jobs.claim_next())
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.COMPLETED)
+        self.assertEqual((job.processed, job.failed, job.progress), (3, 1, 100))
+        self.assertEqual(job.errors, [f"#{missing_pk}: not found"])
+        self.assertFalse(Repair.objects.exclude(status=Repair.Status.COMPLETED).exists())
+        self.part.refresh_from_db()
+        self.assertEqual((self.part.current_stock, self.part.reserved), (3, 0))
+        self.assertIsNone(jobs.claim_next())
+
+    def test_telegram_waits_for_chunk_commit(self):
+        job = jobs.enqueue("repairs.mark_as_completed", [repair.pk for repair in self.repairs], self.user)
+        with mock.patch("repairs.signals.send_telegram_message") as send:
+            with self.captureOnCommitCallbacks() as callbacks:
+                jobs.run(jobs.claim_next())
+            send.assert_not_called()
+            for callback in callbacks:
+                callback()
+        self.assertEqual(send.call_count, job.total)
+
+    def test_worker_marks_crashed_job_failed_and_keeps_running(self):
+        broken = Job.objects.create(task="repairs.mark_as_completed", payload={}, total=1)
+        job = jobs.enqueue("repairs.mark_as_completed", [self.repairs[0].pk], self.user)
+        call_command("run_jobs", once=True, stdout=StringIO())
+        broken.refresh_from_db()
+        job.refresh_from_db()
+        self.assertEqual(broken.status, Job.Status.FAILED)
+        self.assertEqual(broken.errors, ["Job failed: 'ids'"])
+        self.assertEqual(job.status, Job.Status.COMPLETED)
+
+    def test_reclaimed_job_keeps_progress_of_new_worker(self):
+        job = jobs.enqueue("repairs.mark_as_completed", [repair.pk for repair in self.repairs], self.user)
+        claimed = jobs.claim_next()
+        Job.objects.filter(pk=job.pk).update(worker_token=uuid.uuid4())
+        jobs.run(claimed)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.processed), (Job.Status.RUNNING, 0))
+        self.assertFalse(Repair.objects.filter(status=Repair.Status.COMPLETED).exists())
+
+    def test_large_admin_selection_is_queued(self):
+        self.client.force_login(self.user)
+        with self.settings(JOB_INLINE_LIMIT=2):
+            self.client.post(
+                reverse("admin:repairs_repair_changelist"),
+                {"action": "mark_as_completed", "_selected_action": [repair.pk for repair in self.repairs]},
+            )
+        job = Job.objects.get()
+        self.assertEqual((job.task, job.total, job.status), ("repairs.mark_as_completed", 3, Job.Status.QUEUED))
+        self.assertFalse(Repair.objects.filter(status=Repair.Status.COMPLETED).exists())
+
+
+@skipUnless(psycopg_pool, "psycopg_pool is not installed")
+class ConnectionPoolSettingsTests(TestCase):
+    def pool_for(self, health_checks: bool):
+        from django.db.backends.postgresql.base import DatabaseWrapper
+
+        settings_dict = {
+            **settings.DATABASES["default"],
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": "workshop",
+            "CONN_MAX_AGE": 0,
+            "CONN_HEALTH_CHECKS": health_checks,
+            "OPTIONS": {"pool": {"min_size": 1, "max_size": 2}},
+        }
+        alias = f"pool-check-{health_checks}"
+        wrapper = DatabaseWrapper(settings_dict, alias=alias)
+        self.addCleanup(wrapper._connection_pools.pop, alias, None)
+        return wrapper.pool
+
+    def test_health_checks_apply_to_pooled_connections(self):
+        self.assertEqual(self.pool_for(True)._check, psycopg_pool.ConnectionPool.check_connection)
+        self.assertIsNone(self.pool_for(False)._check)
+
+
+class BroadcasterTests(SimpleTestCase):
+    def test_one_listener_fans_out_to_every_client(self):
+        async def scenario():
+            broadcaster = events.Broadcaster()
+            with mock.patch.object(broadcaster, "_run", side_effect=lambda: asyncio.sleep(3600)) as run:
+                first, second = broadcaster.subscribe(), broadcaster.subscribe()
+                listener = broadcaster._task
+                broadcaster.dispatch({"event": "part", "data": {"id": 1}})
+                received = [first.get_nowait(), second.get_nowait()]
+                broadcaster.unsubscribe(first)
+                still_listening = not listener.cancelled() and broadcaster._task is listener
+                broadcaster.unsubscribe(second)
+                await asyncio.sleep(0)
+            return run.call_count, received, still_listening, listener.cancelled()
+
+        calls, received, still_listening, cancelled = asyncio.run(scenario())
+        self.assertEqual(calls, 1)
+        self.assertEqual(received, [{"event": "part", "data": {"id": 1}}] * 2)
+        self.assertTrue(still_listening)
+        self.assertTrue(cancelled)
+
+    def test_failed_notify_does_not_break_the_write(self):
+        failing = mock.Mock(vendor="postgresql")
+        failing.cursor.side_effect = DatabaseError("payload string too long")
+        with mock.patch.object(events, "connection", failing), self.assertLogs("core", "ERROR"):
+            events._notify("{}")
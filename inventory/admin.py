@@ -1,13 +1,26 @@
-from django.contrib import admin
+import time
+from datetime import date
 
+from django.contrib import admin, messages
+from django.core.exceptions import PermissionDenied
+from django.template.response import TemplateResponse
+from django.urls import path
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from inventory import valuation
+from inventory.forecasting import forecast_parts
 from inventory.models import Part
 
+VALUATION_MONTHS = (3, 12, 36)
+
 
 @admin.register(Part)
 class PartAdmin(admin.ModelAdmin):
     list_display = ("code", "name", "current_stock", "reserved", "available", "min_stock", "is_low_stock")
     search_fields = ("code", "name", "supplier")
     list_filter = ("supplier",)
+    actions = ("apply_forecast_min_stock",)
 
     @admin.display(description="Available")
     def available(self, obj: Part) -> int:
@@ -16,3 +29,67 @@ class PartAdmin(admin.ModelAdmin):
     @admin.display(boolean=True, description="Low stock")
     def is_low_stock(self, obj: Part) -> bool:
         return obj.available_stock < obj.min_stock
+
+    def get_urls(self):
+        urls = [
+            path("forecast/", self.admin_site.admin_view(self.forecast_view), name="inventory_part_forecast"),
+            path("valuation/", self.admin_site.admin_view(self.valuation_view), name="inventory_part_valuation"),
+        ]
+        return urls + super().get_urls()
+
+    def forecast_view(self, request):
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        started = time.perf_counter()
+        forecasts = forecast_parts()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "title": _("Reorder forecast"),
+            "forecasts": [row for row in forecasts if row.daily_rate > 0 or row.reorder_quantity],
+            "parts_total": len(forecasts),
+            "elapsed_ms": elapsed_ms,
+        }
+        return TemplateResponse(request, "admin/inventory/part/forecast.html", context)
+
+    def valuation_view(self, request):
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        months = request.GET.get("months", "12")
+        months = int(months) if months in {str(choice) for choice in VALUATION_MONTHS} else 12
+        today = timezone.localdate()
+        year, month = divmod(today.year * 12 + today.month - months, 12)
+        since = date(year, month + 1, 1)
+        started = time.perf_counter()
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "title": _("Inventory valuation"),
+            "months": months,
+            "month_choices": VALUATION_MONTHS,
+            "since": since,
+            "stock_by_supplier": list(valuation.stock_value_by_supplier()),
+            "spend_by_supplier": list(valuation.spend_by("part__supplier", since=since)),
+            "spend_by_device": list(valuation.spend_by("device__name", since=since)),
+            "spend_by_month": list(valuation.spend_by("month", since=since)),
+            "spend_by_device_month": list(valuation.spend_by("month", "device__name", since=since)),
+        }
+        context["elapsed_ms"] = (time.perf_counter() - started) * 1000
+        return TemplateResponse(request, "admin/inventory/part/valuation.html", context)
+
+    @admin.action(description=_("Apply forecast minimum stock"), permissions=["change"])
+    def apply_forecast_min_stock(self, request, queryset):
+        now = timezone.now()
+        changed = []
+        for forecast in forecast_parts(queryset):
+            if forecast.part.min_stock != forecast.proposed_min_stock:
+                forecast.part.min_stock = forecast.proposed_min_stock
+                forecast.part.updated_at = now
+                changed.append(forecast.part)
+        Part.objects.bulk_update(changed, ["min_stock", "updated_at"])
+        self.message_user(
+            request,
+            _("Minimum stock updated for %(count)s parts.") % {"count": len(changed)},
+            level=messages.SUCCESS,
+        )
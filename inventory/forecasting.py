@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Iterable, Optional
+
+import numpy as np
+from django.utils import timezone
+
+from inventory.models import Part, PartConsumption
+
+WINDOW_DAYS = 90
+SMOOTHING_ALPHA = 0.1
+SERVICE_LEVEL_Z = 1.65
+REVIEW_PERIOD_DAYS = 14
+
+
+@dataclass(frozen=True)
+class PartForecast:
+    part: Part
+    daily_rate: float
+    proposed_min_stock: int
+    reorder_quantity: int
+
+
+def consumption_matrix(part_ids: np.ndarray, start: date, days: int) -> np.ndarray:
+    """Return a ``(len(part_ids), days)`` matrix of daily consumption starting at ``start``.
+
+    ``part_ids`` must be sorted; rollup rows for other parts are ignored.
+    """
+    matrix = np.zeros((len(part_ids), days), dtype=np.float64)
+    rows = list(
+        PartConsumption.objects.filter(day__gte=start, day__lt=start + timedelta(days=days)).values_list(
+            "part_id", "day", "quantity"
+        )
+    )
+    if not rows:
+        return matrix
+    row_part_ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    offsets = np.fromiter(((row[1] - start).days for row in rows), dtype=np.int64, count=len(rows))
+    quantities = np.fromiter((row[2] for row in rows), dtype=np.float64, count=len(rows))
+    positions = np.minimum(np.searchsorted(part_ids, row_part_ids), len(part_ids) - 1)
+    known = part_ids[positions] == row_part_ids
+    matrix[positions[known], offsets[known]] = quantities[known]
+    return matrix
+
+
+def smoothing_weights(days: int, alpha: float) -> np.ndarray:
+    """Weights that collapse a daily series into its simple exponential smoothing level."""
+    weights = alpha * (1 - alpha) ** np.arange(days - 1, -1, -1, dtype=np.float64)
+    weights[0] = (1 - alpha) ** (days - 1)
+    return weights
+
+
+def forecast_parts(
+    parts: Optional[Iterable[Part]] = None,
+    *,
+    today: Optional[date] = None,
+    window_days: int = WINDOW_DAYS,
+    alpha: float = SMOOTHING_ALPHA,
+    service_level_z: float = SERVICE_LEVEL_Z,
+    review_period_days: int = REVIEW_PERIOD_DAYS,
+) -> list[PartForecast]:
+    """Forecast demand for all ``parts`` at once from the daily consumption rollup.
+
+    The daily rate is the exponentially smoothed consumption over the last ``window_days``.
+    The proposed minimum stock covers the supplier lead time plus a safety margin, and the
+    reorder quantity tops available stock up to cover the review period as well.
+    """
+    parts = sorted(Part.objects.all() if parts is None else parts, key=lambda part: part.pk)
+    if not parts:
+        return []
+    today = today or timezone.localdate()
+    start = today - timedelta(days=window_days)
+
+    part_ids = np.fromiter((part.pk for part in parts), dtype=np.int64, count=len(parts))
+    lead_times = np.fromiter((part.lead_time_days for part in parts), dtype=np.float64, count=len(parts))
+    available = np.fromiter((part.available_stock for part in parts), dtype=np.float64, count=len(parts))
+
+    matrix = consumption_matrix(part_ids, start, window_days)
+    daily_rate = matrix @ smoothing_weights(window_days, alpha)
+    safety_stock = service_level_z * matrix.std(axis=1) * np.sqrt(lead_times)
+    # Round away float noise so a steady 2.0/day does not ceil up to an extra unit.
+    min_stock = np.ceil(np.round(daily_rate * lead_times + safety_stock, 6))
+    order_up_to = np.ceil(np.round(min_stock + daily_rate * review_period_days, 6))
+    reorder = np.where(available < min_stock, order_up_to - available, 0)
+
+    return [
+        PartForecast(
+            part=part,
+            daily_rate=float(rate),
+            proposed_min_stock=int(proposed),
+            reorder_quantity=int(quantity),
+        )
+        for part, rate, proposed, quantity in zip(parts, daily_rate, min_stock, reorder)
+    ]
+
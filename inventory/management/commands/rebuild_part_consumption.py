@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+
+from inventory.models import PartConsumption
+from repairs.models import RepairPartUsage
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily part consumption rollup from written-off part usages"
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        rows = (
+            RepairPartUsage.objects.filter(written_off=True)
+            .annotate(day=TruncDate("date_used"))
+            .values("part_id", "day")
+            .annotate(total=Sum("quantity"))
+            .order_by()
+        )
+        PartConsumption.objects.all().delete()
+        created = PartConsumption.objects.bulk_create(
+            PartConsumption(part_id=row["part_id"], day=row["day"], quantity=row["total"]) for row in rows
+        )
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(created)} consumption rows."))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import DateField, DecimalField, ExpressionWrapper, F, Sum
+from django.db.models.functions import TruncMonth
+
+from inventory.models import PartSpend
+from repairs.models import RepairPartUsage
+
+
+class Command(BaseCommand):
+    help = "Rebuild the monthly part spend rollup from written-off part usages (at current part prices)"
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        spend = (
+            RepairPartUsage.objects.filter(written_off=True)
+            .order_by()
+            .annotate(month=TruncMonth("date_used", output_field=DateField()))
+            .values("month", "part_id", "repair__device_id")
+            .annotate(
+                total=Sum("quantity"),
+                amount=Sum(
+                    ExpressionWrapper(
+                        F("quantity") * F("part__price"), output_field=DecimalField(max_digits=14, decimal_places=2)
+                    )
+                ),
+            )
+        )
+        PartSpend.objects.all().delete()
+        created = PartSpend.objects.bulk_create(
+            PartSpend(
+                month=row["month"],
+                part_id=row["part_id"],
+                device_id=row["repair__device_id"],
+                quantity=row["total"],
+                amount=row["amount"] or 0,
+            )
+            for row in spend
+        )
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(created)} spend rows."))
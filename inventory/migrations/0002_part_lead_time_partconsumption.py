@@ -0,0 +1,32 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="part",
+            name="lead_time_days",
+            field=models.PositiveIntegerField(default=7, verbose_name="Supplier lead time (days)"),
+        ),
+        migrations.CreateModel(
+            name="PartConsumption",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("day", models.DateField(verbose_name="Day")),
+                ("quantity", models.PositiveIntegerField(default=0, verbose_name="Quantity")),
+                ("part", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="consumption", to="inventory.part", verbose_name="Part")),
+            ],
+            options={
+                "verbose_name": "Part consumption",
+                "verbose_name_plural": "Part consumption",
+                "indexes": [models.Index(fields=["day"], name="inventory_p_day_1cc135_idx")],
+                "unique_together": {("part", "day")},
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0002_part_lead_time_partconsumption"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="part",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name="Updated at"),
+        ),
+    ]
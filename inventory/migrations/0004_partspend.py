@@ -0,0 +1,46 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0003_updated_at"),
+        ("repairs", "0003_technician_queue_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PartSpend",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("month", models.DateField(verbose_name="Month")),
+                ("quantity", models.PositiveIntegerField(default=0, verbose_name="Quantity")),
+                ("amount", models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name="Amount")),
+                (
+                    "device",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="part_spend",
+                        to="repairs.device",
+                        verbose_name="Device",
+                    ),
+                ),
+                (
+                    "part",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="spend",
+                        to="inventory.part",
+                        verbose_name="Part",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Part spend",
+                "verbose_name_plural": "Part spend",
+                "indexes": [models.Index(fields=["month"], name="inventory_p_month_5a654f_idx")],
+                "unique_together": {("month", "part", "device")},
+            },
+        ),
+    ]
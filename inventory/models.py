@@ -1,8 +1,12 @@
+from decimal import Decimal
+
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from core.models import TimeStampedModel
+
 
-class Part(models.Model):
+class Part(TimeStampedModel):
     code = models.CharField(_("Code"), max_length=100, unique=True)
     name = models.CharField(_("Name"), max_length=255)
     description = models.TextField(_("Description"), blank=True)
@@ -11,6 +15,7 @@ class Part(models.Model):
     min_stock = models.PositiveIntegerField(_("Minimum stock"), default=0)
     price = models.DecimalField(_("Price"), max_digits=10, decimal_places=2, null=True, blank=True)
     supplier = models.CharField(_("Supplier"), max_length=255, blank=True)
+    lead_time_days = models.PositiveIntegerField(_("Supplier lead time (days)"), default=7)
 
     class Meta:
         verbose_name = _("Part")
@@ -29,3 +34,59 @@ class Part(models.Model):
             from django.core.exceptions import ValidationError
 
             raise ValidationError({"reserved": _("Reserved cannot exceed current stock.")})
+
+
+class PartConsumption(models.Model):
+    """Daily written-off quantity per part, maintained incrementally on write-off."""
+
+    part = models.ForeignKey(Part, on_delete=models.CASCADE, related_name="consumption", verbose_name=_("Part"))
+    day = models.DateField(_("Day"))
+    quantity = models.PositiveIntegerField(_("Quantity"), default=0)
+
+    class Meta:
+        verbose_name = _("Part consumption")
+        verbose_name_plural = _("Part consumption")
+        unique_together = ("part", "day")
+        indexes = [models.Index(fields=["day"])]
+
+    def __str__(self) -> str:
+        return f"{self.part_id} {self.day}: {self.quantity}"
+
+    @classmethod
+    def record(cls, part_id: int, day, quantity: int) -> None:
+        add_to_rollup(cls, {"part_id": part_id, "day": day}, quantity=quantity)
+
+
+class PartSpend(models.Model):
+    """Monthly written-off parts spend per part and device, maintained incrementally on write-off."""
+
+    month = models.DateField(_("Month"))
+    part = models.ForeignKey(Part, on_delete=models.CASCADE, related_name="spend", verbose_name=_("Part"))
+    device = models.ForeignKey(
+        "repairs.Device", on_delete=models.CASCADE, related_name="part_spend", verbose_name=_("Device")
+    )
+    quantity = models.PositiveIntegerField(_("Quantity"), default=0)
+    amount = models.DecimalField(_("Amount"), max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        verbose_name = _("Part spend")
+        verbose_name_plural = _("Part spend")
+        unique_together = ("month", "part", "device")
+        indexes = [models.Index(fields=["month"])]
+
+    def __str__(self) -> str:
+        return f"{self.month:%Y-%m} {self.part_id}/{self.device_id}: {self.amount}"
+
+    @classmethod
+    def record(cls, month, part_id: int, device_id: int, quantity: int, amount: Decimal) -> None:
+        keys = {"month": month, "part_id": part_id, "device_id": device_id}
+        add_to_rollup(cls, keys, quantity=quantity, amount=amount)
+
+
+def add_to_rollup(model: type[models.Model], keys: dict, **amounts) -> None:
+    """Add ``amounts`` to the ``model`` row matching ``keys``, creating the row on first use."""
+    # Callers hold the part row lock, so the update-then-create pair cannot race.
+    increments = {field: models.F(field) + value for field, value in amounts.items()}
+    updated = model.objects.filter(**keys).update(**increments)
+    if not updated:
+        model.objects.create(**keys, **amounts)
@@ -0,0 +1,23 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from core.events import publish
+from inventory.models import Part
+
+STOCK_FIELDS = {"current_stock", "reserved"}
+
+
+@receiver(post_save, sender=Part)
+def publish_stock_change(sender, instance: Part, update_fields=None, **kwargs):
+    if update_fields is not None and not STOCK_FIELDS.intersection(update_fields):
+        return
+    publish(
+        "part",
+        {
+            "id": instance.pk,
+            "code": instance.code,
+            "current_stock": instance.current_stock,
+            "reserved": instance.reserved,
+            "available": instance.available_stock,
+        },
+    )
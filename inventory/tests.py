@@ -0,0 +1,121 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from inventory import valuation
+from inventory.forecasting import forecast_parts
+from inventory.models import Part, PartConsumption, PartSpend
+from repairs.models import Device, Repair, RepairPartUsage
+
+
+class PartConsumptionTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="tech", password="x")
+        self.device = Device.objects.create(name="CashCode Bill")
+        self.part = Part.objects.create(code="BELT-320", name="Belt", current_stock=10)
+
+    def _complete_repair(self, serial_number: str, quantity: int) -> None:
+        repair = Repair.objects.create(
+            device=self.device, created_by=self.user, serial_number=serial_number, defect="Jams"
+        )
+        RepairPartUsage.objects.create(repair=repair, part=self.part, quantity=quantity)
+        repair.status = Repair.Status.COMPLETED
+        repair.save()
+
+    def test_write_off_accumulates_daily_rollup(self):
+        self._complete_repair("SN1", 2)
+        self._complete_repair("SN2", 3)
+        rollup = PartConsumption.objects.get(part=self.part)
+        self.assertEqual(rollup.day, timezone.localdate())
+        self.assertEqual(rollup.quantity, 5)
+
+
+class ForecastTests(TestCase):
+    def setUp(self):
+        self.today = timezone.localdate()
+        self.busy = Part.objects.create(code="SENSOR", name="Sensor", current_stock=3, lead_time_days=10)
+        self.idle = Part.objects.create(code="SPRING", name="Spring", current_stock=4, min_stock=2)
+        PartConsumption.objects.bulk_create(
+            PartConsumption(part=self.busy, day=self.today - timedelta(days=offset), quantity=2)
+            for offset in range(1, 91)
+        )
+
+    def test_constant_usage_forecast(self):
+        forecasts = {row.part.pk: row for row in forecast_parts(today=self.today)}
+        busy = forecasts[self.busy.pk]
+        self.assertAlmostEqual(busy.daily_rate, 2.0)
+        self.assertEqual(busy.proposed_min_stock, 20)
+        self.assertEqual(busy.reorder_quantity, 20 + 28 - 3)
+
+    def test_forecast_view_requires_part_permission(self):
+        technician = get_user_model().objects.create_user(username="tech", password="x", is_staff=True)
+        self.client.force_login(technician)
+        response = self.client.get(reverse("admin:inventory_part_forecast"))
+        self.assertEqual(response.status_code, 403)
+
+    def test_view_only_user_cannot_apply_forecast(self):
+        viewer = get_user_model().objects.create_user(username="viewer", password="x", is_staff=True)
+        viewer.user_permissions.add(Permission.objects.get(codename="view_part"))
+        self.client.force_login(viewer)
+        self.client.post(
+            reverse("admin:inventory_part_changelist"),
+            {"action": "apply_forecast_min_stock", "_selected_action": [self.idle.pk]},
+        )
+        self.idle.refresh_from_db()
+        self.assertEqual(self.idle.min_stock, 2)
+
+    def test_unused_part_needs_no_stock(self):
+        forecasts = {row.part.pk: row for row in forecast_parts(today=self.today)}
+        idle = forecasts[self.idle.pk]
+        self.assertEqual(idle.daily_rate, 0)
+        self.assertEqual(idle.proposed_min_stock, 0)
+        self.assertEqual(idle.reorder_quantity, 0)
+
+
+class ValuationTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser(username="admin", password="x")
+        self.device = Device.objects.create(name="CashCode Bill")
+        self.belt = Part.objects.create(
+            code="BELT-320", name="Belt", current_stock=10, price="2.50", supplier="CashCode"
+        )
+        Part.objects.create(code="SENSOR", name="Sensor", current_stock=4, price="10.00", supplier="CashCode")
+        Part.objects.create(code="SPRING", name="Spring", current_stock=7, supplier="Local")
+        repair = Repair.objects.create(device=self.device, created_by=self.user, serial_number="SN1", defect="Jams")
+        RepairPartUsage.objects.create(repair=repair, part=self.belt, quantity=4)
+        repair.status = Repair.Status.COMPLETED
+        repair.save()
+
+    def test_stock_value_by_supplier(self):
+        rows = {row["supplier"]: row for row in valuation.stock_value_by_supplier()}
+        self.assertEqual(rows["CashCode"]["stock_value"], Decimal("55.00"))
+        self.assertEqual(rows["CashCode"]["parts"], 2)
+        self.assertEqual(rows["Local"]["stock_value"], Decimal("0.00"))
+
+    def test_write_off_feeds_spend_rollup(self):
+        month = timezone.localdate().replace(day=1)
+        spend = PartSpend.objects.get()
+        self.assertEqual((spend.month, spend.device, spend.quantity), (month, self.device, 4))
+        self.assertEqual(spend.amount, Decimal("10.00"))
+        rows = list(valuation.spend_by("part__supplier", since=month))
+        self.assertEqual(rows, [{"part__supplier": "CashCode", "quantity": 4, "amount": Decimal("10.00")}])
+
+    def test_rebuild_matches_incremental_rollups(self):
+        expected = list(PartSpend.objects.values("month", "part", "device", "quantity", "amount"))
+        call_command("rebuild_part_consumption", stdout=StringIO())
+        call_command("rebuild_part_spend", stdout=StringIO())
+        self.assertEqual(list(PartSpend.objects.values("month", "part", "device", "quantity", "amount")), expected)
+        self.assertEqual(PartConsumption.objects.get().quantity, 4)
+
+    def test_valuation_view(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("admin:inventory_part_valuation"), {"months": "3"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["months"], 3)
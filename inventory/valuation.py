@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce
+
+from inventory.models import Part, PartSpend
+
+MONEY = DecimalField(max_digits=14, decimal_places=2)
+
+
+def _value(quantity_field: str) -> Coalesce:
+    return Coalesce(
+        Sum(ExpressionWrapper(F(quantity_field) * F("price"), output_field=MONEY)),
+        Value(Decimal("0.00")),
+        output_field=MONEY,
+    )
+
+
+def stock_value_by_supplier() -> QuerySet:
+    """Stock and reserved value (quantity × price) per supplier, in one aggregate query."""
+    return (
+        Part.objects.values("supplier")
+        .annotate(parts=Count("id"), stock_value=_value("current_stock"), reserved_value=_value("reserved"))
+        .order_by("-stock_value", "supplier")
+    )
+
+
+def spend_by(*fields: str, since: date) -> QuerySet:
+    """Written-off parts spend from the monthly rollup, grouped by ``fields``."""
+    return (
+        PartSpend.objects.filter(month__gte=since)
+        .values(*fields)
+        .annotate(quantity=Sum("quantity"), amount=Sum("amount"))
+        .order_by(*fields)
+    )
@@ -1,14 +1,22 @@
+import json
 from datetime import timedelta
 
 from django.contrib import admin, messages
 from django.contrib.admin import SimpleListFilter
-from django.db.models import Count
+from django.core.exceptions import PermissionDenied
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Count, Prefetch
 from django.db.models.functions import TruncMonth, TruncWeek, TruncYear
+from django.http import HttpResponse, HttpResponseRedirect, StreamingHttpResponse
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
 from django.utils import timezone
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
-from repairs.models import Device, Repair, RepairPartUsage
+from core import events, jobs
+from repairs.forms import BatchIntakeForm
+from repairs.models import OPEN_STATUSES, Device, Repair, RepairPartUsage
 
 
 STATUS_COLORS = {
@@ -27,6 +35,8 @@ DIFFICULTY_COLORS = {
     Repair.Difficulty.VERY_DIFFICULT: "#ef4444",
 }
 
+BOARD_CLOSED_LIMIT = 20
+
 
 class CreatedAtRangeFilter(SimpleListFilter):
     title = _("created at")
@@ -115,9 +125,12 @@ class RepairAdmin(admin.ModelAdmin):
             obj.created_by = request.user
         super().save_model(request, obj, form, change)
 
+    def is_workshop_admin(self, request) -> bool:
+        return request.user.is_superuser or request.user.groups.filter(name="Admin").exists()
+
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        if request.user.is_superuser or request.user.groups.filter(name="Admin").exists():
+        if self.is_workshop_admin(request):
             return qs
         if request.user.groups.filter(name="Technician").exists():
             return qs.filter(created_by=request.user)
@@ -133,25 +146,145 @@ class RepairAdmin(admin.ModelAdmin):
             return False
         return super().has_change_permission(request, obj)
 
+    def get_urls(self):
+        urls = [
+            path("board/", self.admin_site.admin_view(self.board_view), name="repairs_repair_board"),
+            path("board/stream/", self.admin_site.admin_view(self.board_stream_view), name="repairs_repair_board_stream"),
+            path("intake/", self.admin_site.admin_view(self.batch_intake_view), name="repairs_repair_intake"),
+            path("my-queue/", self.admin_site.admin_view(self.my_queue_view), name="repairs_repair_my_queue"),
+        ]
+        return urls + super().get_urls()
+
+    def board_view(self, request):
+        if not self.has_view_or_change_permission(request):
+            raise PermissionDenied
+        usages = RepairPartUsage.objects.select_related("part").filter(written_off=False)
+        qs = self.get_queryset(request).select_related("device", "created_by")
+        columns = []
+        for status, label in Repair.Status.choices:
+            repairs = qs.filter(status=status)
+            if status in {Repair.Status.COMPLETED, Repair.Status.CLOSED}:
+                repairs = repairs.order_by("-id")[:BOARD_CLOSED_LIMIT]
+            else:
+                repairs = repairs.prefetch_related(Prefetch("part_usages", queryset=usages)).order_by("created_at", "id")
+            columns.append({"status": status, "label": label, "color": STATUS_COLORS[status], "repairs": repairs})
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "title": _("Repair board"),
+            "columns": columns,
+        }
+        return TemplateResponse(request, "admin/repairs/repair/board.html", context)
+
+    def board_stream_view(self, request):
+        if not self.has_view_or_change_permission(request):
+            raise PermissionDenied
+        if not isinstance(request, ASGIRequest):
+            # Under WSGI Django buffers the whole async stream before sending, so an endless stream would hang.
+            return HttpResponse(_("Live updates require the ASGI server."), status=501, content_type="text/plain")
+        only_user_id = None if self.is_workshop_admin(request) else request.user.pk
+
+        async def stream():
+            async for message in events.listen():
+                if message is None:
+                    yield ": keepalive\n\n"
+                    continue
+                data = message["data"]
+                if only_user_id and data.get("created_by_id", only_user_id) != only_user_id:
+                    continue
+                yield f"event: {message['event']}\ndata: {json.dumps(data)}\n\n"
+
+        response = StreamingHttpResponse(stream(), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    def my_queue_view(self, request):
+        if not self.has_view_or_change_permission(request):
+            raise PermissionDenied
+        usages = RepairPartUsage.objects.select_related("part").filter(written_off=False)
+        # Served by the partial repair_open_tech_created_idx index.
+        repairs = list(
+            Repair.objects.filter(created_by=request.user, status__in=OPEN_STATUSES)
+            .select_related("device")
+            .prefetch_related(Prefetch("part_usages", queryset=usages))
+            .order_by("created_at", "id")
+        )
+        for repair in repairs:
+            repair.parts_ready = all(usage.part.current_stock >= usage.quantity for usage in repair.part_usages.all())
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "title": _("My queue"),
+            "repairs": repairs,
+            "awaiting_parts": Repair.Status.AWAITING_PARTS,
+        }
+        return TemplateResponse(request, "admin/repairs/repair/my_queue.html", context)
+
+    def batch_intake_view(self, request):
+        if not self.has_add_permission(request):
+            raise PermissionDenied
+        form = BatchIntakeForm(request.POST or None)
+        if request.method == "POST" and form.is_valid():
+            repairs, flagged = Repair.create_batch(
+                form.cleaned_data["serial_numbers"],
+                device=form.cleaned_data["device"],
+                defect=form.cleaned_data["defect"],
+                repair_difficulty=form.cleaned_data["repair_difficulty"],
+                created_by=request.user,
+                include_open_duplicates=form.cleaned_data["include_open_duplicates"],
+            )
+            self.message_user(
+                request, _("Created %(count)s repairs.") % {"count": len(repairs)}, level=messages.SUCCESS
+            )
+            if flagged:
+                self.message_user(
+                    request,
+                    _("Serial numbers with an open repair: %(serials)s") % {"serials": ", ".join(flagged)},
+                    level=messages.WARNING,
+                )
+            return HttpResponseRedirect(request.path)
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "title": _("Batch intake"),
+            "form": form,
+        }
+        return TemplateResponse(request, "admin/repairs/repair/intake.html", context)
+
+    def run_or_enqueue(self, request, queryset, task: str, done_message) -> None:
+        ids = list(queryset.values_list("pk", flat=True))
+        if jobs.should_queue(len(ids)):
+            job = jobs.enqueue(task, ids, request.user)
+            self.message_user(
+                request,
+                format_html(
+                    '{} <a href="{}">{}</a>',
+                    _("%(count)s repairs were queued.") % {"count": len(ids)},
+                    reverse("admin:core_job_change", args=[job.pk]),
+                    _("Track progress"),
+                ),
+                level=messages.INFO,
+            )
+            return
+        _model, handler = jobs.TASKS[task]
+        for repair in queryset:
+            handler(repair)
+        self.message_user(request, done_message, level=messages.SUCCESS)
+
     @admin.action(description=_("Mark selected repairs as completed"))
     def mark_as_completed(self, request, queryset):
-        for repair in queryset:
-            repair.status = Repair.Status.COMPLETED
-            repair.full_clean()
-            repair.save(update_fields=["status"])
-        self.message_user(request, _("Selected repairs were marked as completed."), level=messages.SUCCESS)
+        self.run_or_enqueue(
+            request, queryset, "repairs.mark_as_completed", _("Selected repairs were marked as completed.")
+        )
 
     @admin.action(description=_("Write-off parts for selected repairs"))
     def write_off_parts_action(self, request, queryset):
-        for repair in queryset:
-            repair.write_off_parts()
-        self.message_user(request, _("Parts were written off."), level=messages.SUCCESS)
+        self.run_or_enqueue(request, queryset, "repairs.write_off_parts", _("Parts were written off."))
 
     @admin.action(description=_("Release reserved parts"))
     def release_reserved_parts_action(self, request, queryset):
-        for repair in queryset:
-            repair.release_reserved_parts()
-        self.message_user(request, _("Reserved parts released."), level=messages.SUCCESS)
+        self.run_or_enqueue(request, queryset, "repairs.release_reserved_parts", _("Reserved parts released."))
 
     def changelist_view(self, request, extra_context=None):
         now = timezone.now()
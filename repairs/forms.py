@@ -0,0 +1,39 @@
+from django import forms
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+from repairs.models import Device, Repair
+
+MAX_BATCH_SIZE = 200
+
+
+class BatchIntakeForm(forms.Form):
+    device = forms.ModelChoiceField(label=_("Device"), queryset=Device.objects.filter(is_active=True))
+    defect = forms.CharField(label=_("Defect"), widget=forms.Textarea(attrs={"rows": 2}))
+    repair_difficulty = forms.ChoiceField(
+        label=_("Repair difficulty"), choices=Repair.Difficulty.choices, initial=Repair.Difficulty.NORMAL
+    )
+    serial_numbers = forms.CharField(
+        label=_("Serial numbers"),
+        widget=forms.Textarea(attrs={"rows": 15, "autofocus": True}),
+        help_text=_("Scan one serial number per line."),
+    )
+    include_open_duplicates = forms.BooleanField(
+        label=_("Create repairs for serials that already have an open repair"), required=False
+    )
+
+    def clean_serial_numbers(self) -> list[str]:
+        max_length = Repair._meta.get_field("serial_number").max_length
+        serials = list(dict.fromkeys(line.strip() for line in self.cleaned_data["serial_numbers"].splitlines()))
+        serials = [serial for serial in serials if serial]
+        if not serials:
+            raise ValidationError(_("Scan at least one serial number."))
+        if len(serials) > MAX_BATCH_SIZE:
+            raise ValidationError(_("A batch is limited to %(max)s serial numbers.") % {"max": MAX_BATCH_SIZE})
+        too_long = [serial for serial in serials if len(serial) > max_length]
+        if too_long:
+            raise ValidationError(
+                _("Serial numbers longer than %(max)s characters: %(serials)s")
+                % {"max": max_length, "serials": ", ".join(too_long)}
+            )
+        return serials
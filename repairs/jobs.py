@@ -0,0 +1,19 @@
+from core.jobs import register
+from repairs.models import Repair
+
+
+@register("repairs.mark_as_completed", Repair)
+def mark_as_completed(repair: Repair) -> None:
+    repair.status = Repair.Status.COMPLETED
+    repair.full_clean()
+    repair.save(update_fields=["status"])
+
+
+@register("repairs.write_off_parts", Repair)
+def write_off_parts(repair: Repair) -> None:
+    repair.write_off_parts()
+
+
+@register("repairs.release_reserved_parts", Repair)
+def release_reserved_parts(repair: Repair) -> None:
+    repair.release_reserved_parts()
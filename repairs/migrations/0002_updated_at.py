@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("repairs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="device",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name="Updated at"),
+        ),
+        migrations.AddField(
+            model_name="repair",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name="Updated at"),
+        ),
+        migrations.AddField(
+            model_name="repairpartusage",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name="Updated at"),
+        ),
+    ]
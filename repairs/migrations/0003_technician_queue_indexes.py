@@ -0,0 +1,36 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("repairs", "0002_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="repair",
+            name="serial_number",
+            field=models.CharField(max_length=50, verbose_name="Serial number"),
+        ),
+        migrations.AddIndex(
+            model_name="repair",
+            index=models.Index(fields=["created_by", "status", "created_at"], name="repair_tech_status_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="repair",
+            index=models.Index(
+                condition=models.Q(("status__in", ["New", "Awaiting Parts", "In Progress"])),
+                fields=["created_by", "created_at"],
+                name="repair_open_tech_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="repair",
+            index=models.Index(
+                condition=models.Q(("status__in", ["New", "Awaiting Parts", "In Progress"])),
+                fields=["created_at"],
+                name="repair_open_created_idx",
+            ),
+        ),
+    ]
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import logging
 from decimal import Decimal
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from core.events import publish
+from core.models import TimeStampedModel
+from inventory.models import PartConsumption, PartSpend
 
-class Device(models.Model):
+logger = logging.getLogger("repairs")
+
+# Repair.Status values of unfinished repairs. Kept at module level so Repair.Meta index conditions can use it.
+OPEN_STATUSES = ["New", "Awaiting Parts", "In Progress"]
+# Repairs per "repair_batch" event; PostgreSQL rejects NOTIFY payloads of 8000 bytes or more.
+BATCH_EVENT_SIZE = 50
+
+
+class Device(TimeStampedModel):
     name = models.CharField(_("Name"), max_length=255, unique=True)
     description = models.TextField(_("Description"), blank=True)
     is_active = models.BooleanField(_("Is active"), default=True)
@@ -21,7 +34,7 @@ class Device(models.Model):
         return self.name
 
 
-class Repair(models.Model):
+class Repair(TimeStampedModel):
     class Difficulty(models.TextChoices):
         TEST = "Test", _("Test")
         SIMPLE = "Simple", _("Simple")
@@ -50,7 +63,7 @@ class Repair(models.Model):
         on_delete=models.PROTECT,
         related_name="repairs",
     )
-    serial_number = models.CharField(_("Serial number"), max_length=50, db_index=True)
+    serial_number = models.CharField(_("Serial number"), max_length=50)
     defect = models.TextField(_("Defect"))
     repair_difficulty = models.CharField(
         _("Repair difficulty"),
@@ -74,6 +87,18 @@ class Repair(models.Model):
         indexes = [
             models.Index(fields=["serial_number"]),
             models.Index(fields=["status", "created_at"]),
+            models.Index(fields=["created_by", "status", "created_at"], name="repair_tech_status_created_idx"),
+            # Partial indexes over OPEN_STATUSES stay small as closed history grows.
+            models.Index(
+                fields=["created_by", "created_at"],
+                name="repair_open_tech_created_idx",
+                condition=models.Q(status__in=OPEN_STATUSES),
+            ),
+            models.Index(
+                fields=["created_at"],
+                name="repair_open_created_idx",
+                condition=models.Q(status__in=OPEN_STATUSES),
+            ),
         ]
 
     def __str__(self) -> str:
@@ -88,6 +113,55 @@ class Repair(models.Model):
                         _("Not enough stock to complete repair for part %(part)s.") % {"part": usage.part.code}
                     )
 
+    @classmethod
+    @transaction.atomic
+    def create_batch(
+        cls,
+        serial_numbers: list[str],
+        *,
+        device: Device,
+        defect: str,
+        repair_difficulty: str,
+        created_by,
+        include_open_duplicates: bool = False,
+    ) -> tuple[list[Repair], list[str]]:
+        """Create one repair per serial number; returns the repairs and the serials flagged as already open.
+
+        Flagged serials are skipped unless ``include_open_duplicates`` is set.
+        """
+        open_serials = set(
+            cls.objects.filter(serial_number__in=serial_numbers, status__in=OPEN_STATUSES).values_list(
+                "serial_number", flat=True
+            )
+        )
+        flagged = [serial for serial in serial_numbers if serial in open_serials]
+        repairs = cls.objects.bulk_create(
+            cls(
+                device=device,
+                created_by=created_by,
+                serial_number=serial,
+                defect=defect,
+                repair_difficulty=repair_difficulty,
+            )
+            for serial in serial_numbers
+            if include_open_duplicates or serial not in open_serials
+        )
+        # bulk_create skips the per-save signals; announce the batch in slices that stay under the NOTIFY size limit.
+        for start in range(0, len(repairs), BATCH_EVENT_SIZE):
+            chunk = repairs[start : start + BATCH_EVENT_SIZE]
+            publish(
+                "repair_batch",
+                {
+                    "status": cls.Status.NEW,
+                    "device": str(device),
+                    "created_by_id": created_by.pk,
+                    "repairs": [[repair.pk, repair.serial_number] for repair in chunk],
+                },
+            )
+        if repairs:
+            logger.info("Batch intake created %s repairs for %s", len(repairs), device)
+        return repairs, flagged
+
     @property
     def total_parts_cost(self) -> Decimal:
         total = Decimal("0.00")
@@ -111,6 +185,11 @@ class Repair(models.Model):
             part.save(update_fields=["current_stock", "reserved"])
             usage.written_off = True
             usage.save(update_fields=["written_off"])
+            day = timezone.localdate(usage.date_used)
+            PartConsumption.record(part.pk, day, usage.quantity)
+            PartSpend.record(
+                day.replace(day=1), part.pk, self.device_id, usage.quantity, (part.price or 0) * usage.quantity
+            )
 
     @transaction.atomic
     def release_reserved_parts(self) -> None:
@@ -124,7 +203,7 @@ class Repair(models.Model):
             part.save(update_fields=["reserved"])
 
 
-class RepairPartUsage(models.Model):
+class RepairPartUsage(TimeStampedModel):
     repair = models.ForeignKey(Repair, on_delete=models.CASCADE, related_name="part_usages", verbose_name=_("Repair"))
     part = models.ForeignKey("inventory.Part", on_delete=models.PROTECT, verbose_name=_("Part"))
     quantity = models.PositiveIntegerField(_("Quantity"), default=1)
@@ -179,4 +258,3 @@ class RepairPartUsage(models.Model):
                 part.full_clean()
                 part.save(update_fields=["reserved"])
             return super().delete(*args, **kwargs)
-
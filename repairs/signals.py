@@ -1,9 +1,11 @@
 import logging
 
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 
+from core.events import publish
 from core.telegram import send_telegram_message
 from repairs.models import Repair
 
@@ -15,6 +17,7 @@ def write_off_parts_on_status_change(sender, instance: Repair, **kwargs):
     old_status = None
     if instance.pk:
         old_status = sender.objects.filter(pk=instance.pk).values_list("status", flat=True).first()
+    instance._previous_status = old_status
 
     if old_status == instance.status:
         return
@@ -27,6 +30,24 @@ def write_off_parts_on_status_change(sender, instance: Repair, **kwargs):
             raise
 
 
+@receiver(post_save, sender=Repair)
+def publish_status_change(sender, instance: Repair, created: bool, **kwargs):
+    previous_status = getattr(instance, "_previous_status", None)
+    if not created and previous_status == instance.status:
+        return
+    publish(
+        "repair",
+        {
+            "id": instance.pk,
+            "status": instance.status,
+            "previous_status": previous_status,
+            "device": str(instance.device),
+            "serial_number": instance.serial_number,
+            "created_by_id": instance.created_by_id,
+        },
+    )
+
+
 @receiver(post_save, sender=Repair)
 def notify_status_change(sender, instance: Repair, created: bool, **kwargs):
     if created:
@@ -45,4 +66,5 @@ def notify_status_change(sender, instance: Repair, created: bool, **kwargs):
     )
     if awaiting_parts:
         message += f" | Awaiting: {awaiting_parts}"
-    send_telegram_message(message)
+    # The HTTP call must not run while the save's transaction holds part row locks.
+    transaction.on_commit(lambda: send_telegram_message(message))
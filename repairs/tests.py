@@ -1,8 +1,13 @@
+import json
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.test import TestCase
+from django.urls import reverse
 
 from inventory.models import Part
+from repairs.forms import MAX_BATCH_SIZE
 from repairs.models import Device, Repair, RepairPartUsage
 
 
@@ -34,3 +39,136 @@ class RepairStockLogicTests(TestCase):
         self.part.refresh_from_db()
         self.assertEqual(self.part.current_stock, 2)
         self.assertEqual(self.part.reserved, 0)
+
+
+class RepairBoardTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser(username="admin", password="x")
+        self.device = Device.objects.create(name="CashCode Bill")
+        self.part = Part.objects.create(code="BELT-320", name="Belt", current_stock=5)
+        self.repair = Repair.objects.create(
+            device=self.device,
+            created_by=self.user,
+            serial_number="SN123",
+            defect="Does not accept bills",
+        )
+
+    def test_status_change_publishes_repair_and_part_events(self):
+        RepairPartUsage.objects.create(repair=self.repair, part=self.part, quantity=2)
+        with mock.patch("core.events._notify") as notify, self.captureOnCommitCallbacks(execute=True):
+            self.repair.status = Repair.Status.COMPLETED
+            self.repair.save()
+        published = [json.loads(call.args[0]) for call in notify.call_args_list]
+        self.assertIn(
+            {"id": self.part.pk, "code": "BELT-320", "current_stock": 3, "reserved": 0, "available": 3},
+            [message["data"] for message in published if message["event"] == "part"],
+        )
+        repair_events = [message["data"] for message in published if message["event"] == "repair"]
+        self.assertEqual(len(repair_events), 1)
+        self.assertEqual(repair_events[0]["previous_status"], Repair.Status.NEW)
+        self.assertEqual(repair_events[0]["status"], Repair.Status.COMPLETED)
+
+    def test_unchanged_status_publishes_nothing(self):
+        with mock.patch("core.events._notify") as notify, self.captureOnCommitCallbacks(execute=True):
+            self.repair.note = "Checked"
+            self.repair.save()
+        notify.assert_not_called()
+
+    def test_stream_refused_outside_asgi(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("admin:repairs_repair_board_stream"))
+        self.assertEqual(response.status_code, 501)
+
+    def test_board_groups_repairs_by_status(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("admin:repairs_repair_board"))
+        self.assertEqual(response.status_code, 200)
+        new_column = next(column for column in response.context["columns"] if column["status"] == Repair.Status.NEW)
+        self.assertEqual(list(new_column["repairs"]), [self.repair])
+
+
+class BatchIntakeTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser(username="admin", password="x")
+        self.device = Device.objects.create(name="CashCode Bill")
+        Repair.objects.create(device=self.device, created_by=self.user, serial_number="OPEN-1", defect="Jams")
+        Repair.objects.create(
+            device=self.device,
+            created_by=self.user,
+            serial_number="DONE-1",
+            defect="Jams",
+            status=Repair.Status.CLOSED,
+        )
+
+    def test_batch_skips_serials_with_open_repairs(self):
+        with mock.patch("core.events._notify") as notify, self.captureOnCommitCallbacks(execute=True):
+            repairs, flagged = Repair.create_batch(
+                ["NEW-1", "OPEN-1", "DONE-1"],
+                device=self.device,
+                defect="Does not accept bills",
+                repair_difficulty=Repair.Difficulty.SIMPLE,
+                created_by=self.user,
+            )
+        self.assertEqual(flagged, ["OPEN-1"])
+        self.assertEqual([repair.serial_number for repair in repairs], ["NEW-1", "DONE-1"])
+        self.assertEqual(notify.call_count, 1)
+        self.assertEqual(Repair.objects.filter(serial_number="OPEN-1").count(), 1)
+
+    def test_full_batch_events_fit_in_notify_payload(self):
+        serials = [f"{i:03d}".ljust(50, "X") for i in range(MAX_BATCH_SIZE)]
+        with mock.patch("core.events._notify") as notify, self.captureOnCommitCallbacks(execute=True):
+            repairs, _ = Repair.create_batch(
+                serials,
+                device=self.device,
+                defect="Does not accept bills",
+                repair_difficulty=Repair.Difficulty.SIMPLE,
+                created_by=self.user,
+            )
+        messages = [call.args[0] for call in notify.call_args_list]
+        self.assertTrue(all(len(message.encode()) < 8000 for message in messages))
+        published = [pk for message in messages for pk, _ in json.loads(message)["data"]["repairs"]]
+        self.assertEqual(published, [repair.pk for repair in repairs])
+
+    def test_intake_view_creates_repairs(self):
+        self.client.force_login(self.user)
+        response = self.client.post(
+            reverse("admin:repairs_repair_intake"),
+            {
+                "device": self.device.pk,
+                "defect": "Does not accept bills",
+                "repair_difficulty": Repair.Difficulty.NORMAL,
+                "serial_numbers": "SN-1\nSN-2\n\nSN-1\nOPEN-1\n",
+                "include_open_duplicates": "on",
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Repair.objects.filter(serial_number__in=["SN-1", "SN-2"]).count(), 2)
+        self.assertEqual(Repair.objects.filter(serial_number="OPEN-1").count(), 2)
+
+
+class MyQueueTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser(username="admin", password="x")
+        other = get_user_model().objects.create_user(username="other", password="x")
+        device = Device.objects.create(name="CashCode Bill")
+        self.part = Part.objects.create(code="BELT-320", name="Belt", current_stock=5)
+        self.awaiting = Repair.objects.create(
+            device=device,
+            created_by=self.user,
+            serial_number="SN1",
+            defect="Jams",
+            status=Repair.Status.AWAITING_PARTS,
+        )
+        self.new = Repair.objects.create(device=device, created_by=self.user, serial_number="SN2", defect="Jams")
+        Repair.objects.create(
+            device=device, created_by=self.user, serial_number="SN3", defect="Jams", status=Repair.Status.CLOSED
+        )
+        Repair.objects.create(device=device, created_by=other, serial_number="SN4", defect="Jams")
+        RepairPartUsage.objects.create(repair=self.awaiting, part=self.part, quantity=2)
+
+    def test_queue_lists_own_open_repairs_oldest_first(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("admin:repairs_repair_my_queue"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["repairs"], [self.awaiting, self.new])
+        self.assertTrue(response.context["repairs"][0].parts_ready)
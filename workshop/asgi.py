@@ -2,4 +2,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "workshop.settings")
+# Persistent connections are not safe under ASGI (each sync view may run in a different thread);
+# use POSTGRES_POOL=True for connection reuse instead.
+os.environ["POSTGRES_CONN_MAX_AGE"] = "0"
 application = get_asgi_application()
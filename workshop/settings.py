@@ -57,9 +57,24 @@ DATABASES = {
         "PASSWORD": os.getenv("POSTGRES_PASSWORD", "workshop"),
         "HOST": os.getenv("POSTGRES_HOST", "localhost"),
         "PORT": os.getenv("POSTGRES_PORT", "5432"),
+        "CONN_MAX_AGE": int(os.getenv("POSTGRES_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": os.getenv("POSTGRES_CONN_HEALTH_CHECKS", "True").lower() == "true",
     }
 }
 
+if os.getenv("POSTGRES_POOL", "False").lower() == "true":
+    # psycopg pool owns connection reuse; Django refuses persistent connections alongside it.
+    # CONN_HEALTH_CHECKS still applies: Django passes ConnectionPool.check_connection as the pool's
+    # check callback, so a "check" key here would be a duplicate argument.
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.getenv("POSTGRES_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("POSTGRES_POOL_MAX_SIZE", "10")),
+            "timeout": float(os.getenv("POSTGRES_POOL_TIMEOUT", "10")),
+        }
+    }
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -85,6 +100,11 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+ANALYTICS_DIR = Path(os.getenv("ANALYTICS_DIR") or BASE_DIR / "analytics")
+
+# Admin actions on more objects than this are queued for `manage.py run_jobs` instead of running in the request.
+JOB_INLINE_LIMIT = int(os.getenv("JOB_INLINE_LIMIT", "20"))
+
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "")
 
@@ -95,6 +115,7 @@ LOGGING = {
         "console": {"class": "logging.StreamHandler"},
     },
     "loggers": {
+        "core": {"handlers": ["console"], "level": "INFO"},
         "repairs": {"handlers": ["console"], "level": "INFO"},
         "inventory": {"handlers": ["console"], "level": "INFO"},
     },